@@ -30,7 +30,10 @@ object_name = "test-data-001.txt"
 response = None
 try:
     response = client.get_object(bucketName, prefix, object_name)
-    # Read data from response.
+    # Read data from response in chunks as they arrive from the server.
+    for data in response.stream(amt=64*1024):
+        print(len(data))
 finally:
-    response.close()
-    response.release_conn()
+    if response:
+        response.close()
+        response.release_conn()
@@ -34,8 +34,43 @@ __version__ = "1.0.0"
 __license__ = "Apache 2.0"
 __copyright__ = "Copyright 2024 Newtera"
 
-# pylint: disable=unused-import,useless-import-alias
-from .api import Newtera as Newtera
-from .error import InvalidResponseError as InvalidResponseError
-from .error import NewteraError as NewteraError
-from .error import ServerError as ServerError
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    # pylint: disable=unused-import,useless-import-alias
+    from .aio import AsyncNewtera as AsyncNewtera
+    from .api import Newtera as Newtera
+    from .error import InvalidResponseError as InvalidResponseError
+    from .error import NewteraError as NewteraError
+    from .error import ServerError as ServerError
+
+__all__ = [
+    "AsyncNewtera",
+    "InvalidResponseError",
+    "Newtera",
+    "NewteraError",
+    "ServerError",
+]
+
+# Submodules pull in urllib3 and friends; import them on first access.
+_LAZY_IMPORTS = {
+    "AsyncNewtera": ".aio",
+    "Newtera": ".api",
+    "InvalidResponseError": ".error",
+    "NewteraError": ".error",
+    "ServerError": ".error",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# Newtera Python Library for Newtera TDM,
+# (C) 2024 Newtera, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""asyncio interface of Newtera TDM client."""
+
+from __future__ import absolute_import, annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Iterable, TextIO, TypeVar
+
+import urllib3
+
+try:
+    from urllib3.response import BaseHTTPResponse  # type: ignore[attr-defined]
+except ImportError:
+    from urllib3.response import HTTPResponse as BaseHTTPResponse
+
+from .api import Newtera
+from .datatypes import Object, ObjectModel
+from .helpers import DictType, ObjectWriteResult, ProgressType
+
+T = TypeVar("T")
+
+
+class AsyncNewtera:
+    """
+    asyncio variant of :class:`Newtera <Newtera>`. Blocking calls run on a
+    thread pool sized to the connection pool, so many coroutines can have
+    requests in flight over the shared keep-alive connections.
+
+    Accepts the same parameters as :class:`Newtera <Newtera>`.
+
+    Example::
+        async with AsyncNewtera("localhost:8080", "ACCESS-KEY", "SECRET-KEY") \\
+                as client:
+            results = await asyncio.gather(
+                client.stat_object("tdm", "my-prefix", "my-object1"),
+                client.stat_object("tdm", "my-prefix", "my-object2"),
+            )
+    """
+    _client: Newtera
+    _executor: ThreadPoolExecutor
+    _owns_http: bool
+
+    def __init__(
+            self,
+            endpoint: str,
+            access_key: str | None = None,
+            secret_key: str | None = None,
+            secure: bool = False,
+            http_client: urllib3.PoolManager | None = None,
+            maxsize: int = 10,
+            num_pools: int = 10,
+            block: bool = False,
+    ):
+        self._client = Newtera(
+            endpoint,
+            access_key=access_key,
+            secret_key=secret_key,
+            secure=secure,
+            http_client=http_client,
+            maxsize=maxsize,
+            num_pools=num_pools,
+            block=block,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=maxsize)
+        # Caller supplied HTTP client may be shared with other clients.
+        self._owns_http = http_client is None
+
+    async def __aenter__(self) -> AsyncNewtera:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Shutdown worker threads and close pooled connections, unless the
+        HTTP client is supplied by caller.
+        """
+        self._executor.shutdown(wait=False)
+        if self._owns_http:
+            self._client._http.clear()  # pylint: disable=protected-access
+
+    def trace_on(self, stream: TextIO):
+        """Enable http trace."""
+        self._client.trace_on(stream)
+
+    def trace_off(self):
+        """Disable HTTP trace."""
+        self._client.trace_off()
+
+    async def _run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run blocking client call in worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs),
+        )
+
+    async def bucket_exists(self, bucket_name: str) -> bool:
+        """Check if a bucket exists."""
+        return await self._run(self._client.bucket_exists, bucket_name)
+
+    async def list_objects(
+            self,
+            bucket_name: str,
+            prefix: str | None = None,
+    ) -> list[ObjectModel]:
+        """Lists object information of a bucket."""
+        return await self._run(
+            self._client.list_objects, bucket_name, prefix=prefix,
+        )
+
+    async def stat_object(
+            self,
+            bucket_name: str,
+            prefix: str,
+            object_name: str,
+            extra_headers: DictType | None = None,
+    ) -> Object:
+        """Get object information of an object."""
+        return await self._run(
+            self._client.stat_object,
+            bucket_name,
+            prefix,
+            object_name,
+            extra_headers=extra_headers,
+        )
+
+    async def get_object(
+            self,
+            bucket_name: str,
+            prefix: str,
+            object_name: str,
+            offset: int = 0,
+            length: int = 0,
+            request_headers: DictType | None = None,
+    ) -> BaseHTTPResponse:
+        """
+        Get data of an object. Response body is read with blocking calls;
+        prefer :meth:`fget_object` to save data without blocking the loop.
+        """
+        return await self._run(
+            self._client.get_object,
+            bucket_name,
+            prefix,
+            object_name,
+            offset=offset,
+            length=length,
+            request_headers=request_headers,
+        )
+
+    async def fget_object(
+            self,
+            bucket_name: str,
+            prefix: str,
+            object_name: str,
+            file_path: str,
+            request_headers: DictType | None = None,
+            tmp_file_path: str | None = None,
+            progress: ProgressType | None = None,
+    ) -> Object:
+        """Downloads data of an object to file."""
+        return await self._run(
+            self._client.fget_object,
+            bucket_name,
+            prefix,
+            object_name,
+            file_path,
+            request_headers=request_headers,
+            tmp_file_path=tmp_file_path,
+            progress=progress,
+        )
+
+    async def put_object(
+            self,
+            bucket_name: str,
+            prefix: str,
+            object_name: str,
+            data: BinaryIO,
+            length: int,
+            content_type: str = "application/octet-stream",
+            progress: ProgressType | None = None,
+            part_size: int = 0,
+    ) -> ObjectWriteResult:
+        """Uploads data from a stream to an object in a bucket."""
+        return await self._run(
+            self._client.put_object,
+            bucket_name,
+            prefix,
+            object_name,
+            data,
+            length,
+            content_type=content_type,
+            progress=progress,
+            part_size=part_size,
+        )
+
+    async def fput_object(
+            self,
+            bucket_name: str,
+            prefix: str,
+            object_name: str,
+            file_path: str,
+            content_type: str = "application/octet-stream",
+            progress: ProgressType | None = None,
+    ) -> ObjectWriteResult:
+        """Uploads data from a file to an object in a bucket."""
+        return await self._run(
+            self._client.fput_object,
+            bucket_name,
+            prefix,
+            object_name,
+            file_path,
+            content_type=content_type,
+            progress=progress,
+        )
+
+    async def stat_objects(
+            self,
+            bucket_name: str,
+            prefix: str,
+            object_names: Iterable[str],
+            max_workers: int | None = None,
+    ) -> list[tuple[str, Object | Exception]]:
+        """
+        Get object information of multiple objects concurrently; returns
+        list of (object name, object information or error) in completion
+        order.
+        """
+        return await self._run(
+            lambda: list(
+                self._client.stat_objects(
+                    bucket_name,
+                    prefix,
+                    object_names,
+                    max_workers=max_workers,
+                ),
+            ),
+        )
+
+    async def remove_object(
+            self,
+            bucket_name: str,
+            prefix: str,
+            object_name: str,
+    ):
+        """Remove an object."""
+        await self._run(
+            self._client.remove_object, bucket_name, prefix, object_name,
+        )
+
+    async def remove_objects(
+            self,
+            bucket_name: str,
+            prefix: str,
+            object_names: Iterable[str],
+            max_workers: int | None = None,
+    ) -> list[tuple[str, Exception]]:
+        """Remove multiple objects concurrently."""
+        return await self._run(
+            self._client.remove_objects,
+            bucket_name,
+            prefix,
+            object_names,
+            max_workers=max_workers,
+        )
@@ -23,14 +23,21 @@
 
 from __future__ import absolute_import, annotations
 
+import functools
 import os
-from datetime import datetime, timedelta
-from typing import BinaryIO, TextIO, Union, cast
-from urllib.parse import urlunsplit
+import platform
+import shutil
+from concurrent.futures import (FIRST_COMPLETED, FIRST_EXCEPTION,
+                                ThreadPoolExecutor, wait)
+from datetime import timedelta
+from itertools import chain, islice
+from typing import Any, BinaryIO, Iterable, Iterator, NoReturn, TextIO, cast
+from urllib.parse import SplitResult, urlunsplit
 
 import urllib3
 from urllib3 import Retry
 from urllib3._collections import HTTPHeaderDict
+from urllib3.poolmanager import PoolKey
 
 try:
     from urllib3.response import BaseHTTPResponse  # type: ignore[attr-defined]
@@ -42,14 +49,147 @@ from urllib3.util import Timeout
 from . import __title__, __version__
 from .credentials import StaticProvider
 from .credentials.providers import Provider
-from .datatypes import (Object, ObjectModel,
-                        parse_list_objects)
+from .datatypes import Object, ObjectModel, parse_list_objects
 from .error import InvalidResponseError, NewteraError, ServerError
-from .helpers import (BaseURL, DictType, ObjectWriteResult, ProgressType,
-                      check_bucket_name, check_non_empty_string,
-                      get_part_info,
-                      headers_to_strings, makedirs,
-                      read_part_data)
+from .helpers import (BaseURL, BodyReader, DictType, ObjectWriteResult,
+                      ProgressType, ReadAhead, check_bucket_name,
+                      check_non_empty_string, get_part_info,
+                      get_stream_remaining_size, headers_to_strings,
+                      iter_part_data, makedirs, read_part_data)
+
+_DEFAULT_USER_AGENT = (
+    f"Newtera ({platform.system()}; {platform.machine()}) "
+    f"{__title__}/{__version__}"
+)
+
+# Write file bodies to socket in 64KiB units instead of urllib3's default
+# 16KiB; older urllib3 does not accept the blocksize pool argument.
+_POOL_KWARGS: dict[str, Any] = (
+    {"blocksize": 64 * 1024} if "key_blocksize" in PoolKey._fields else {}
+)
+
+# Retry is immutable; urllib3 derives a new object on each increment.
+_DEFAULT_RETRY = Retry(
+    total=5,
+    backoff_factor=0.2,
+    status_forcelist=[500, 502, 503, 504]
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _url_to_string(url: SplitResult) -> str:
+    """Get URL string of recently built (cached) request URL."""
+    return urlunsplit(url)
+
+
+# Bodies longer than this are truncated in HTTP trace.
+_TRACE_BODY_LIMIT = 64 * 1024
+
+
+def _trace_body(data: bytes) -> str:
+    """Get body text for HTTP trace."""
+    if len(data) > _TRACE_BODY_LIMIT:
+        return (
+            data[:_TRACE_BODY_LIMIT].decode(errors="replace") +
+            f"...({len(data)} bytes)"
+        )
+    return data.decode(errors="replace")
+
+
+def _trace_request(
+        trace: TextIO,
+        method: str,
+        url: SplitResult,
+        headers: DictType,
+        body: bytes | BinaryIO | Iterator[bytes | memoryview] | None,
+):
+    """Write HTTP request to trace stream."""
+    query = ("?" + url.query) if url.query else ""
+    trace_parts = [
+        "---------START-HTTP---------\n",
+        f"{method} {url.path}{query} HTTP/1.1\n",
+        headers_to_strings(headers, titled_key=True),
+        "\n",
+    ]
+    if body is not None:
+        trace_parts += [
+            "\n",
+            _trace_body(body) if isinstance(body, bytes) else str(body),
+            "\n",
+        ]
+    trace_parts.append("\n")
+    trace.write("".join(trace_parts))
+
+
+def _trace_response(
+        trace: TextIO,
+        response: BaseHTTPResponse,
+        trace_body: bool,
+        end: bool,
+):
+    """Write HTTP response status, headers and optionally body to trace."""
+    trace_parts = [
+        f"HTTP/1.1 {response.status}\n",
+        headers_to_strings(response.headers),
+        "\n",
+    ]
+    if trace_body:
+        trace_parts += ["\n", _trace_body(response.data), "\n"]
+    if end:
+        trace_parts.append("----------END-HTTP----------\n")
+    trace.write("".join(trace_parts))
+
+
+_ERROR_CODES = {
+    403: ("AccessDenied", "Access denied"),
+    405: (
+        "MethodNotAllowed",
+        "The specified method is not allowed against this resource",
+    ),
+    501: (
+        "MethodNotAllowed",
+        "The specified method is not allowed against this resource",
+    ),
+}
+
+_DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024  # 4MiB
+_DOWNLOAD_RANGE_SIZE = 16 * 1024 * 1024  # 16MiB
+_PARALLEL_DOWNLOAD_MIN_SIZE = 2 * _DOWNLOAD_RANGE_SIZE
+_DOWNLOAD_WORKERS = 4
+# Upload parts are read into reused buffers; with one part queued by
+# ReadAhead, one is being sent and one is being read.
+_UPLOAD_BUFFERS = 3
+
+
+def _write_response(
+        response: BaseHTTPResponse,
+        file: BinaryIO,
+        progress: ProgressType | None = None,
+) -> int:
+    """Write response data to file and return its size."""
+    if not progress:
+        start = file.tell()
+        shutil.copyfileobj(response, file, _DOWNLOAD_CHUNK_SIZE)
+        return file.tell() - start
+    size = 0
+    while True:
+        data = response.read(_DOWNLOAD_CHUNK_SIZE)
+        if not data:
+            break
+        file.write(data)
+        size += len(data)
+        progress.update(len(data))
+    return size
+
+
+def _check_range_size(offset: int, expected: int, size: int):
+    """Check size of data downloaded for a byte range."""
+    if size != expected:
+        raise IOError(
+            f"range at offset {offset} having unexpected data;"
+            f"expected: {expected}, "
+            f"got: {size} bytes"
+        )
 
 
 class Newtera:
@@ -63,6 +203,12 @@ class Newtera:
     :param secure: Flag to indicate to use secure (TLS) connection to Newtera TDM
         service or not.
     :param http_client: Customized HTTP client.
+    :param maxsize: Maximum number of connections kept alive per host; raise
+        it to the number of threads sharing this client.
+    :param num_pools: Number of per-host connection pools kept by the HTTP
+        client.
+    :param block: Flag to wait for a free connection when maxsize connections
+        are in use instead of opening a new one.
     :param credentials: Credentials provider of your account in Newtera TDM service.
     :return: :class:`Newtera <Newtera>` object
 
@@ -78,9 +224,11 @@ class Newtera:
 
     """
     _base_url: BaseURL
+    _base_headers: DictType
     _trace_stream: TextIO | None
     _provider: Provider | None
     _http: urllib3.PoolManager
+    _maxsize: int
 
     def __init__(
             self,
@@ -89,6 +237,9 @@ class Newtera:
             secret_key: str | None = None,
             secure: bool = False,
             http_client: urllib3.PoolManager | None = None,
+            maxsize: int = 10,
+            num_pools: int = 10,
+            block: bool = False,
     ):
         # Validate http client has correct base class.
         if http_client and not isinstance(http_client, urllib3.PoolManager):
@@ -99,124 +250,128 @@ class Newtera:
         self._base_url = BaseURL(
             ("https://" if secure else "http://") + endpoint,
         )
+        # Headers which are the same for every request of this client.
+        self._base_headers = {
+            "Host": self._base_url.host,
+            "User-Agent": _DEFAULT_USER_AGENT,
+        }
         self._trace_stream = None
+        self._provider = None
         if access_key:
             if secret_key is None:
                 raise ValueError("secret key must be provided with access key")
-            credentials = StaticProvider(access_key, secret_key)
-        self._provider = credentials
+            self._provider = StaticProvider(access_key, secret_key)
 
-        # Load CA certificates from SSL_CERT_FILE file if set
+        # HTTP/1.1 connections are kept alive by default and reused across
+        # requests; unless block is set, connections beyond maxsize are opened
+        # on demand and discarded after use.
         timeout = timedelta(minutes=5).seconds
+        self._maxsize = maxsize
         self._http = http_client or urllib3.PoolManager(
             timeout=Timeout(connect=timeout, read=timeout),
-            maxsize=10,
+            num_pools=num_pools,
+            maxsize=maxsize,
+            block=block,
             cert_reqs='CERT_NONE',
-            retries=Retry(
-                total=5,
-                backoff_factor=0.2,
-                status_forcelist=[500, 502, 503, 504]
-            )
+            retries=_DEFAULT_RETRY,
+            **_POOL_KWARGS,
         )
 
     def __del__(self):
         if hasattr(self, "_http"):  # Only required for unit test run
             self._http.clear()
 
-    def _build_headers(
-            self,
-            host: str,
-            headers: DictType | None,
-            body: bytes | None,
-    ) -> tuple[DictType, datetime]:
-        """Build headers with given parameters."""
-        headers = headers or {}
-        headers["Host"] = host
-
-        if body:
-            headers["Content-Length"] = str(len(body))
-        return headers
-
     def _url_open(
             self,
             method: str,
-            request_path: str,
+            url: SplitResult,
             bucket_name: str | None = None,
             object_name: str | None = None,
-            body: bytes | None = None,
+            body: bytes | BinaryIO | Iterator[bytes | memoryview] | None = None,
             headers: DictType | None = None,
-            query_params: DictType | None = None,
             preload_content: bool = True,
             no_body_trace: bool = False,
     ) -> BaseHTTPResponse:
-        """Execute HTTP request."""
-        url = self._base_url.build(
-            method,
-            request_path,
-            bucket_name=bucket_name,
-            object_name=object_name,
-            query_params=query_params,
+        """Execute HTTP request to given URL."""
+        # Only caller headers can be multi-valued; base headers are strings.
+        # Callers sending a body set its Content-Length.
+        multi_valued = bool(headers) and any(
+            isinstance(value, (list, tuple))
+            for value in cast(DictType, headers).values()
         )
-        headers = self._build_headers(url.netloc, headers, body)
-
-        if self._trace_stream:
-            self._trace_stream.write("---------START-HTTP---------\n")
-            query = ("?" + url.query) if url.query else ""
-            self._trace_stream.write(f"{method} {url.path}{query} HTTP/1.1\n")
-            self._trace_stream.write(
-                headers_to_strings(headers, titled_key=True),
+        headers = {**(headers or {}), **self._base_headers}
+
+        trace = self._trace_stream
+        if trace:
+            _trace_request(
+                trace, method, url, headers,
+                None if no_body_trace else body,
             )
-            self._trace_stream.write("\n")
-            if not no_body_trace and body is not None:
-                self._trace_stream.write("\n")
-                self._trace_stream.write(
-                    body.decode() if isinstance(body, bytes) else str(body),
-                )
-                self._trace_stream.write("\n")
-            self._trace_stream.write("\n")
-
-        http_headers = HTTPHeaderDict()
-        for key, value in (headers or {}).items():
-            if isinstance(value, (list, tuple)):
-                for val in value:
-                    http_headers.add(key, val)
-            else:
-                http_headers.add(key, value)
 
-        http_headers.add("AccessKey", self._provider.retrieve().access_key)
-        http_headers.add("SecretKey", self._provider.retrieve().secret_key)
+        http_headers: DictType | HTTPHeaderDict = headers
+        if multi_valued:
+            # Only multi-valued headers need HTTPHeaderDict.
+            http_headers = HTTPHeaderDict()
+            for key, value in headers.items():
+                if isinstance(value, (list, tuple)):
+                    for val in value:
+                        http_headers.add(key, val)
+                else:
+                    http_headers.add(key, value)
+
+        if self._provider:
+            creds = self._provider.retrieve()
+            http_headers["AccessKey"] = creds.access_key
+            http_headers["SecretKey"] = creds.secret_key
 
         response = self._http.urlopen(
             method,
-            urlunsplit(url),
+            _url_to_string(url),
             body=body,
             headers=http_headers,
             preload_content=preload_content,
+            # Iterated body is consumed by the first attempt; never resend it.
+            retries=(
+                None
+                if body is None or isinstance(body, bytes) or
+                hasattr(body, "read")
+                else False
+            ),
         )
 
-        if self._trace_stream:
-            self._trace_stream.write(f"HTTP/1.1 {response.status}\n")
-            self._trace_stream.write(
-                headers_to_strings(response.headers),
-            )
-            self._trace_stream.write("\n")
-
         if response.status in [200, 204, 206]:
-            if self._trace_stream:
-                if preload_content:
-                    self._trace_stream.write("\n")
-                    self._trace_stream.write(response.data.decode())
-                    self._trace_stream.write("\n")
-                self._trace_stream.write("----------END-HTTP----------\n")
+            if trace:
+                _trace_response(trace, response, preload_content, True)
             return response
 
+        if trace:
+            _trace_response(trace, response, False, False)
+        self._handle_error_response(
+            method,
+            url,
+            response,
+            preload_content,
+            bucket_name=bucket_name,
+            object_name=object_name,
+        )
+
+    def _handle_error_response(
+            self,
+            method: str,
+            url: SplitResult,
+            response: BaseHTTPResponse,
+            preload_content: bool,
+            bucket_name: str | None = None,
+            object_name: str | None = None,
+    ) -> NoReturn:
+        """Raise error for unsuccessful HTTP response."""
         response.read(cache_content=True)
         if not preload_content:
             response.release_conn()
 
-        if self._trace_stream and method != "HEAD" and response.data:
-            self._trace_stream.write(response.data.decode())
-            self._trace_stream.write("\n")
+        trace = self._trace_stream
+        if trace and method != "HEAD" and response.data:
+            trace.write(_trace_body(response.data) + "\n")
 
         if (
                 method != "HEAD" and
@@ -224,8 +379,8 @@ class Newtera:
                     "content-type", "",
                 ).split(";")
         ):
-            if self._trace_stream:
-                self._trace_stream.write("----------END-HTTP----------\n")
+            if trace:
+                trace.write("----------END-HTTP----------\n")
             if response.status == 304 and not response.data:
                 raise ServerError(
                     f"server failed with HTTP status code {response.status}",
@@ -238,8 +393,8 @@ class Newtera:
             )
 
         if not response.data and method != "HEAD":
-            if self._trace_stream:
-                self._trace_stream.write("----------END-HTTP----------\n")
+            if trace:
+                trace.write("----------END-HTTP----------\n")
             raise InvalidResponseError(
                 response.status,
                 response.headers.get("content-type"),
@@ -248,44 +403,34 @@ class Newtera:
 
         response_error = NewteraError.fromxml(response) if response.data else None
 
-        if self._trace_stream:
-            self._trace_stream.write("----------END-HTTP----------\n")
-
-        error_map = {
-            403: lambda: ("AccessDenied", "Access denied"),
-            404: lambda: (
-                ("NoSuchKey", "Object does not exist")
-                if object_name
-                else ("NoSuchBucket", "Bucket does not exist")
-                if bucket_name
-                else ("ResourceNotFound", "Request resource not found")
-            ),
-            405: lambda: (
-                "MethodNotAllowed",
-                "The specified method is not allowed against this resource",
-            ),
-            409: lambda: (
-                ("NoSuchBucket", "Bucket does not exist")
-                if bucket_name
-                else ("ResourceConflict", "Request resource conflicts"),
-            ),
-            501: lambda: (
-                "MethodNotAllowed",
-                "The specified method is not allowed against this resource",
-            ),
-        }
+        if trace:
+            trace.write("----------END-HTTP----------\n")
 
         if not response_error:
-            func = error_map.get(response.status)
-            code, message = func() if func else (None, None)
+            if response.status == 404:
+                code, message = (
+                    ("NoSuchKey", "Object does not exist")
+                    if object_name
+                    else ("NoSuchBucket", "Bucket does not exist")
+                    if bucket_name
+                    else ("ResourceNotFound", "Request resource not found")
+                )
+            elif response.status == 409:
+                code, message = (
+                    ("NoSuchBucket", "Bucket does not exist")
+                    if bucket_name
+                    else ("ResourceConflict", "Request resource conflicts")
+                )
+            else:
+                code, message = _ERROR_CODES.get(response.status, ("", ""))
             if not code:
                 raise ServerError(
                     f"server failed with HTTP status code {response.status}",
                     response.status,
                 )
             response_error = NewteraError(
-                cast(str, code),
-                cast(Union[str, None], message),
+                code,
+                message,
                 url.path,
                 response.headers.get("x-amz-request-id"),
                 response.headers.get("x-amz-id-2"),
@@ -302,46 +447,39 @@ class Newtera:
             request_path: str,
             bucket_name: str | None = None,
             object_name: str | None = None,
-            body: bytes | None = None,
+            body: bytes | BinaryIO | Iterator[bytes | memoryview] | None = None,
             headers: DictType | None = None,
             query_params: DictType | None = None,
             preload_content: bool = True,
             no_body_trace: bool = False,
     ) -> BaseHTTPResponse:
         """Execute HTTP request."""
- 
+        url = self._base_url.build(
+            method,
+            request_path,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            query_params=query_params,
+        )
+        url_open = functools.partial(
+            self._url_open,
+            method,
+            url,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            body=body,
+            headers=headers,
+            preload_content=preload_content,
+            no_body_trace=no_body_trace,
+        )
         try:
-            return self._url_open(
-                method,
-                request_path=request_path,
-                bucket_name=bucket_name,
-                object_name=object_name,
-                body=body,
-                headers=headers,
-                query_params=query_params,
-                preload_content=preload_content,
-                no_body_trace=no_body_trace,
-            )
+            return url_open()
         except NewteraError as exc:
             if exc.code != "RetryHead":
                 raise
 
         # Retry only once on RetryHead error.
-        try:
-            return self._url_open(
-                method,
-                request_path=request_path,
-                bucket_name=bucket_name,
-                object_name=object_name,
-                body=body,
-                headers=headers,
-                query_params=query_params,
-                preload_content=preload_content,
-                no_body_trace=no_body_trace,
-            )
-        except NewteraError as exc:
-            if exc.code != "RetryHead":
-                raise
+        return url_open()
 
     def trace_on(self, stream: TextIO):
         """
@@ -441,7 +579,9 @@ class Newtera:
         :param request_headers: Any additional headers to be added with GET
                                 request.
         :param tmp_file_path: Path to a temporary file.
-        :param progress: A progress object
+        :param progress: A progress object; for a large object, downloaded
+                         as concurrent byte ranges, its update() is called
+                         from several worker threads at the same time.
         :return: Object information.
 
         Example::
@@ -464,18 +604,39 @@ class Newtera:
             object_name,
         )
 
+        # Download large objects as concurrent byte ranges.
+        object_size = stat.size or 0
+        range_size = (
+            _DOWNLOAD_RANGE_SIZE
+            if object_size > _PARALLEL_DOWNLOAD_MIN_SIZE else 0
+        )
+
         response = None
         try:
             response = self.get_object(
                 bucket_name,
                 prefix,
                 object_name,
+                length=range_size,
                 request_headers=request_headers,
             )
+            # Server may ignore Range header and send the whole object.
+            ranged = range_size and response.status == 206
+            content_range = response.headers.get("Content-Range", "")
+            if ranged and "/" in content_range:
+                total = content_range.rsplit("/", 1)[1]
+                if total != "*" and int(total) != object_size:
+                    raise IOError(
+                        f"object size {total} in Content-Range does not "
+                        f"match object size {object_size}"
+                    )
 
             if progress:
                 # Set progress bar length and object name before upload
-                length = int(response.headers.get('content-length', 0))
+                length = (
+                    object_size if ranged
+                    else int(response.headers.get('content-length', 0))
+                )
                 progress.set_meta(object_name=object_name, total_length=length)
 
              # Write to a temporary file "file_path.part.newtera" before saving.
@@ -484,10 +645,21 @@ class Newtera:
             )
 
             with open(tmp_file_path, "wb") as tmp_file:
-                for data in response.stream(amt=1024*1024):
-                    size = tmp_file.write(data)
-                    if progress:
-                        progress.update(size)
+                if ranged:
+                    tmp_file.truncate(object_size)
+                size = _write_response(response, tmp_file, progress)
+            if ranged:
+                _check_range_size(0, min(range_size, object_size), size)
+                self._fget_ranges(
+                    bucket_name,
+                    prefix,
+                    object_name,
+                    tmp_file_path,
+                    range_size,
+                    object_size,
+                    request_headers=request_headers,
+                    progress=progress,
+                )
             if os.path.exists(file_path):
                 os.remove(file_path)  # For windows compatibility.
             os.rename(tmp_file_path, file_path)
@@ -497,6 +669,54 @@ class Newtera:
                 response.close()
                 response.release_conn()
 
+    def _fget_ranges(
+            self,
+            bucket_name: str,
+            prefix: str,
+            object_name: str,
+            file_path: str,
+            offset: int,
+            size: int,
+            request_headers: DictType | None = None,
+            progress: ProgressType | None = None,
+    ):
+        """Download object data from offset till size to file concurrently."""
+        def download(range_offset):
+            response = self.get_object(
+                bucket_name,
+                prefix,
+                object_name,
+                offset=range_offset,
+                length=min(_DOWNLOAD_RANGE_SIZE, size - range_offset),
+                request_headers=request_headers,
+            )
+            try:
+                # Each worker writes its range through its own file object.
+                with open(file_path, "r+b") as file:
+                    file.seek(range_offset)
+                    _check_range_size(
+                        range_offset,
+                        min(_DOWNLOAD_RANGE_SIZE, size - range_offset),
+                        _write_response(response, file, progress),
+                    )
+            finally:
+                response.close()
+                response.release_conn()
+
+        with ThreadPoolExecutor(
+                max_workers=min(_DOWNLOAD_WORKERS, self._maxsize),
+        ) as executor:
+            futures = [
+                executor.submit(download, range_offset)
+                for range_offset in range(offset, size, _DOWNLOAD_RANGE_SIZE)
+            ]
+            # Fail on the first failed range; don't start remaining ones.
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                future.cancel()
+            for future in done:
+                future.result()
+
     def get_object(
             self,
             bucket_name: str,
@@ -523,8 +743,10 @@ class Newtera:
         Example::
             # Get data of an object.
             try:
-                response = client.get_object("tdm", "my-object")
-                # Read data from response.
+                response = client.get_object("tdm", "my-prefix", "my-object")
+                # Read data from response without buffering the whole object.
+                for data in response.stream(amt=64*1024):
+                    ...
             finally:
                 response.close()
                 response.release_conn()
@@ -558,7 +780,7 @@ class Newtera:
             bucket_name: str,
             prefix: str,
             object_name: str,
-            data: bytes,
+            data: bytes | BinaryIO | Iterator[bytes | memoryview],
             headers: DictType | None,
             query_params: DictType | None = None,
     ) -> ObjectWriteResult:
@@ -582,6 +804,36 @@ class Newtera:
             response.headers,
         )
 
+    def _put_parts(
+            self,
+            bucket_name: str,
+            prefix: str,
+            object_name: str,
+            parts: Iterator[bytes | memoryview],
+            headers: DictType,
+            first_part: bytes | None = None,
+    ) -> ObjectWriteResult:
+        """Upload parts read ahead in background in a single request."""
+        reader = ReadAhead(parts)
+        try:
+            return self._put_object(
+                bucket_name,
+                prefix,
+                object_name,
+                chain((first_part,), reader) if first_part else reader,
+                headers,
+            )
+        except Exception:
+            # HTTP client wraps error raised by body iterator; raise the
+            # original read error instead.
+            if reader.error:
+                raise reader.error from None
+            raise
+        finally:
+            # Don't return while the producer may still read caller's stream.
+            reader.close()
+            reader.join()
+
     def put_object(
         self,
         bucket_name: str,
@@ -603,6 +855,7 @@ class Newtera:
         :param length: Data size; -1 for unknown size and set valid part_size.
         :param content_type: Content type of the object.
         :param progress: A progress object;
+        :param part_size: Size of parts read from the stream.
         :return: :class:`ObjectWriteResult` object.
 
         Example::
@@ -622,58 +875,74 @@ class Newtera:
             # Set progress bar length and object name before upload
             progress.set_meta(object_name=object_name, total_length=length)
 
-        headers = {}
+        headers: DictType = {}
         headers["Content-Type"] = content_type or "application/octet-stream"
-        headers["newtera-meta-user"] = self._provider.retrieve().access_key
+        if self._provider:
+            headers["newtera-meta-user"] = self._provider.retrieve().access_key
+
+        if get_stream_remaining_size(data) >= length > 0:
+            # Let HTTP client read seekable stream directly, so that it can
+            # rewind the stream on retry.
+            headers["Content-Length"] = str(length)
+            return self._put_object(
+                bucket_name,
+                prefix,
+                object_name,
+                cast(BinaryIO, BodyReader(data, length, progress=progress)),
+                headers,
+            )
 
-        object_size = length
-        uploaded_size = 0
-        part_number = 0
-        one_byte = b""
-        stop = False
-        upload_id = None
+        if part_count > 1:
+            # Newtera TDM accepts an object in a single PUT request only; send
+            # the parts of non-seekable stream as they are read instead of
+            # buffering the object. Such request is not retried.
+            headers["Content-Length"] = str(length)
+            return self._put_parts(
+                bucket_name,
+                prefix,
+                object_name,
+                iter_part_data(
+                    data,
+                    length,
+                    part_size,
+                    progress=progress,
+                    buffer_count=_UPLOAD_BUFFERS,
+                ),
+                headers,
+            )
 
-        try:
-            while not stop:
-                part_number += 1
-                if part_count > 0:
-                    if part_number == part_count:
-                        part_size = object_size - uploaded_size
-                        stop = True
-                    part_data = read_part_data(
-                        data, part_size, progress=progress,
-                    )
-                    if len(part_data) != part_size:
-                        raise IOError(
-                            f"stream having not enough data;"
-                            f"expected: {part_size}, "
-                            f"got: {len(part_data)} bytes"
-                        )
-                else:
-                    part_data = read_part_data(
-                        data, part_size + 1, one_byte, progress=progress,
-                    )
-                    # If part_data_size is less or equal to part_size,
-                    # then we have reached last part.
-                    if len(part_data) <= part_size:
-                        part_count = part_number
-                        stop = True
-                    else:
-                        one_byte = part_data[-1:]
-                        part_data = part_data[:-1]
-
-                uploaded_size += len(part_data)
-
-                if part_count == 1:
-                    return self._put_object(
-                        bucket_name, prefix, object_name, part_data, headers,
-                    )
-        except Exception as exc:
-            if upload_id:
-                self._abort_multipart_upload(
-                    bucket_name, object_name, upload_id,
+        if part_count == 1:
+            part_data = read_part_data(data, length, progress=progress)
+            if len(part_data) != length:
+                raise IOError(
+                    f"stream having not enough data;"
+                    f"expected: {length}, "
+                    f"got: {len(part_data)} bytes"
                 )
-            raise exc
+        else:
+            # Size is unknown; read one byte more than a part to find out
+            # whether the object fits in a single-shot request.
+            part_data = read_part_data(data, part_size + 1, progress=progress)
+            if len(part_data) > part_size:
+                return self._put_parts(
+                    bucket_name,
+                    prefix,
+                    object_name,
+                    iter_part_data(
+                        data,
+                        -1,
+                        part_size,
+                        progress=progress,
+                        buffer_count=_UPLOAD_BUFFERS,
+                    ),
+                    headers,
+                    first_part=part_data,
+                )
+
+        headers["Content-Length"] = str(len(part_data))
+        return self._put_object(
+            bucket_name, prefix, object_name, part_data, headers,
+        )
 
     def list_objects(
             self,
@@ -723,27 +992,82 @@ class Newtera:
         check_non_empty_string(object_name)
         check_non_empty_string(prefix)
 
-        headers = cast(DictType, {})
-        if extra_headers:
-            headers.update(extra_headers)
-
         response = self._execute(
             "HEAD",
             "/api/blob/objects/",
             bucket_name,
             object_name,
-            headers=headers,
+            headers=extra_headers,
             query_params={"prefix": prefix},
         )
 
+        headers = response.headers
         return Object(
             bucket_name,
             object_name,
-            size=int(response.headers.get("Length", "0")),
-            content_type=response.headers.get("ContentType"),
-            metadata=response.headers,
+            size=int(headers.get("Length", "0")),
+            content_type=headers.get("ContentType"),
+            metadata=headers,
         )
 
+    def stat_objects(
+        self,
+        bucket_name: str,
+        prefix: str,
+        object_names: Iterable[str],
+        max_workers: int | None = None,
+    ) -> Iterator[tuple[str, Object | Exception]]:
+        """
+        Get object information of multiple objects concurrently. Results are
+        yielded as they complete, not in the order of object names; an error
+        getting an object, including a connection error, is yielded as its
+        result. At most max_workers requests are in flight, so object names
+        are consumed as results are yielded, and stopping the iteration early
+        waits for those requests only.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Object name starts with prefix.
+        :param object_names: Object names in the bucket.
+        :param max_workers: Maximum number of concurrent requests; defaults
+            to the connection pool size.
+        :return: Iterator of (object name, :class:`Object <Object>` or error).
+
+        Example::
+            # Get information of objects.
+            for object_name, result in client.stat_objects(
+                    "tdm", "my-prefix", ["my-object1", "my-object2"],
+            ):
+                if isinstance(result, Exception):
+                    print("error occurred when getting", object_name, result)
+                else:
+                    print(object_name, result.size)
+        """
+        def stat(object_name):
+            try:
+                return object_name, self.stat_object(
+                    bucket_name, prefix, object_name,
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                return object_name, exc
+
+        max_workers = max_workers or self._maxsize
+        names = iter(object_names)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Keep at most max_workers requests in flight; object names are
+            # taken as requests complete.
+            pending = {
+                executor.submit(stat, object_name)
+                for object_name in islice(names, max_workers)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending |= {
+                    executor.submit(stat, object_name)
+                    for object_name in islice(names, len(done))
+                }
+                for future in done:
+                    yield future.result()
+
     def remove_object(
         self,
         bucket_name: str,
@@ -774,6 +1098,47 @@ class Newtera:
             query_params={"prefix": prefix},
         )
 
+    def remove_objects(
+        self,
+        bucket_name: str,
+        prefix: str,
+        object_names: Iterable[str],
+        max_workers: int | None = None,
+    ) -> list[tuple[str, Exception]]:
+        """
+        Remove multiple objects concurrently. An error removing an object,
+        including a connection error, is returned instead of being raised.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Object name starts with prefix.
+        :param object_names: Object names in the bucket.
+        :param max_workers: Maximum number of concurrent requests; defaults
+            to the connection pool size so every request reuses a kept-alive
+            connection.
+        :return: List of (object name, error) for objects failed to remove.
+
+        Example::
+            # Remove objects.
+            errors = client.remove_objects(
+                "tdm", "my-prefix", ["my-object1", "my-object2"],
+            )
+            for object_name, error in errors:
+                print("error occurred when removing", object_name, error)
+        """
+        def remove(object_name):
+            try:
+                self.remove_object(bucket_name, prefix, object_name)
+            except Exception as exc:  # pylint: disable=broad-except
+                return object_name, exc
+            return None
+
+        with ThreadPoolExecutor(
+                max_workers=max_workers or self._maxsize,
+        ) as executor:
+            return [
+                error for error in executor.map(remove, object_names) if error
+            ]
+
     def _list_objects(
             self,
             bucket_name: str,
@@ -33,10 +33,10 @@ except ImportError:
     from urllib3.response import HTTPResponse as BaseHTTPResponse
 
 import json
-from types import SimpleNamespace
 
 class Bucket:
     """Bucket information."""
+    __slots__ = ("_name", "_creation_date")
 
     def __init__(self, name: str, creation_date: datetime | None):
         self._name = name
@@ -74,6 +74,11 @@ B = TypeVar("B", bound="Object")
 
 class Object:
     """Object information."""
+    __slots__ = (
+        "_bucket_name", "_object_name", "_last_modified", "_etag", "_size",
+        "_metadata", "_version_id", "_is_latest", "_storage_class",
+        "_owner_id", "_owner_name", "_content_type", "_is_delete_marker",
+    )
 
     def __init__(  # pylint: disable=too-many-arguments
             self,
@@ -179,6 +184,10 @@ class Object:
 
 class ObjectModel:
     """Object model."""
+    __slots__ = (
+        "_id", "_name", "_description", "_created", "_modified", "_size",
+        "_type", "_suffix", "_instanceId", "_className", "_creator",
+    )
 
     def __init__(  # pylint: disable=too-many-arguments
             self,
@@ -255,14 +264,20 @@ class ObjectModel:
 def parse_list_objects(
         response: BaseHTTPResponse,
 ) -> list[ObjectModel]:
-
-    objectList = []
-    jsonData = json.loads(response.data, object_hook=lambda d: SimpleNamespace(**d))
-
-    for o in jsonData.files:
-        obj = ObjectModel(o.id, o.name, o.description, o.created, o.modified, o.size, o.type, o.suffix, o.instanceId, o.className, o.creator)
-        objectList.append(obj)
-
-    return objectList
-
-
+    """Parse ListObjects JSON response."""
+    return [
+        ObjectModel(
+            obj["id"],
+            obj["name"],
+            obj["description"],
+            obj["created"],
+            obj["modified"],
+            obj["size"],
+            obj["type"],
+            obj["suffix"],
+            obj["instanceId"],
+            obj["className"],
+            obj["creator"],
+        )
+        for obj in json.loads(response.data)["files"]
+    ]
@@ -31,15 +31,12 @@ and API specific errors.
 from __future__ import absolute_import, annotations
 
 from typing import Type, TypeVar
-from xml.etree import ElementTree as ET
 
 try:
     from urllib3.response import BaseHTTPResponse  # type: ignore[attr-defined]
 except ImportError:
     from urllib3.response import HTTPResponse as BaseHTTPResponse
 
-from .xml import findtext
-
 
 class NewteraException(Exception):
     """Base Newtera exception."""
@@ -140,6 +137,12 @@ class NewteraError(NewteraException):
     @classmethod
     def fromxml(cls: Type[A], response: BaseHTTPResponse) -> A:
         """Create new object with values from XML element."""
+        # XML parser is only needed for error responses; import it lazily.
+        # pylint: disable=import-outside-toplevel
+        from xml.etree import ElementTree as ET
+
+        from .xml import findtext
+
         element = ET.fromstring(response.data.decode())
         return cls(
             findtext(element, "Code"),
@@ -19,12 +19,18 @@
 from __future__ import absolute_import, annotations, division, unicode_literals
 
 import errno
+import functools
+import io
 import math
 import os
+import queue
 import re
+import stat as statmod
+import threading
 import urllib.parse
 from datetime import datetime
-from typing import BinaryIO, Dict, List, Mapping, Tuple, Union
+from typing import (BinaryIO, Callable, Dict, Iterator, List, Mapping, Tuple,
+                    Union)
 
 from urllib3._collections import HTTPHeaderDict
 
@@ -36,14 +42,14 @@ MAX_PART_SIZE = 5 * 1024 * 1024 * 1024  # 5GiB
 MIN_PART_SIZE = 5 * 1024 * 1024  # 5MiB
 
 _BUCKET_NAME_REGEX = re.compile(r'^[a-z0-9][a-z0-9\.\-]{1,61}[a-z0-9]$')
-
-_IPV4_REGEX = re.compile(
-    r'^((25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9][0-9]|[0-9])\.){3}'
-    r'(25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9][0-9]|[0-9])$')
+_CREDENTIAL_REGEX = re.compile(r"Credential=([^/]+)")
+_SIGNATURE_REGEX = re.compile(r"Signature=([0-9a-f]+)")
+_READ_AHEAD_POLL_INTERVAL = 0.1  # seconds
 
 DictType = Dict[str, Union[str, List[str], Tuple[str]]]
 
 
+@functools.lru_cache(maxsize=1024)
 def quote(
         resource: str,
         safe: str = "/",
@@ -52,7 +58,8 @@ def quote(
 ) -> str:
     """
     Wrapper to urllib.parse.quote() replacing back to '~' for older python
-    versions.
+    versions. Results are cached as the same bucket, prefix and object names
+    are usually encoded over and over.
     """
     return urllib.parse.quote(
         resource,
@@ -81,10 +88,9 @@ def headers_to_strings(
     for key, value in headers.items():
         key = key.title() if titled_key else key
         for item in value if isinstance(value, (list, tuple)) else [value]:
-            item = re.sub(
-                r"Credential=([^/]+)",
+            item = _CREDENTIAL_REGEX.sub(
                 "Credential=*REDACTED*",
-                re.sub(r"Signature=([0-9a-f]+)", "Signature=*REDACTED*", item),
+                _SIGNATURE_REGEX.sub("Signature=*REDACTED*", item),
             ) if titled_key else item
             values.append(f"{key}: {item}")
     return "\n".join(values)
@@ -160,17 +166,237 @@ def read_part_data(
 ) -> bytes:
     """Read part data of given size from stream."""
     size -= len(part_data)
+    # Collect chunks and join once; growing bytes by concatenation copies
+    # the accumulated data on every short read.
+    chunks = [part_data] if part_data else []
     while size:
         data = stream.read(size)
         if not data:
             break  # EOF reached
         if not isinstance(data, bytes):
             raise ValueError("read() must return 'bytes' object")
-        part_data += data
+        chunks.append(data)
         size -= len(data)
         if progress:
             progress.update(len(data))
-    return part_data
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def iter_part_data(
+        stream: BinaryIO,
+        object_size: int,
+        part_size: int,
+        progress: ProgressType | None = None,
+        buffer_count: int = 0,
+) -> Iterator[bytes | memoryview]:
+    """
+    Read object data of given size from stream part by part; -1 object size
+    reads till EOF. With buffer_count, parts are read into that many reused
+    buffers, so a yielded part is overwritten buffer_count parts later.
+    """
+    readinto = getattr(stream, "readinto", None) if buffer_count else None
+    buffers: list[memoryview] = []
+    read_size = 0
+    while object_size < 0 or read_size < object_size:
+        size = (
+            part_size if object_size < 0
+            else min(part_size, object_size - read_size)
+        )
+        part_data: bytes | memoryview
+        if readinto:
+            buffer = (
+                memoryview(bytearray(part_size))
+                if len(buffers) < buffer_count else buffers.pop(0)
+            )
+            buffers.append(buffer)
+            filled = 0
+            try:
+                while filled < size:
+                    length = readinto(buffer[filled:size])
+                    if not length:
+                        break  # EOF reached
+                    filled += length
+                    if progress:
+                        progress.update(length)
+                part_data = buffer[:filled]
+            except (NotImplementedError, io.UnsupportedOperation):
+                # RawIOBase subclass implementing read() only.
+                readinto = None
+                part_data = read_part_data(
+                    stream,
+                    size,
+                    part_data=bytes(buffer[:filled]),
+                    progress=progress,
+                )
+        else:
+            part_data = read_part_data(stream, size, progress=progress)
+        if object_size < 0:
+            if not part_data:
+                return  # EOF reached
+        elif len(part_data) != size:
+            raise IOError(
+                f"stream having not enough data;"
+                f"expected: {size}, "
+                f"got: {len(part_data)} bytes"
+            )
+        read_size += len(part_data)
+        yield part_data
+
+
+class ReadAhead:
+    """
+    Iterator of parts produced by a background thread, so reading the next
+    part overlaps with sending the current one; at most depth parts are
+    queued, i.e. depth + 2 parts are alive including those being read and
+    sent. Error raised while reading parts is kept in error.
+    """
+    THREAD_NAME = "newtera-read-ahead"
+
+    def __init__(
+            self,
+            parts: Iterator[bytes | memoryview],
+            depth: int = 1,
+    ):
+        self._parts = parts
+        self._items: queue.Queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._finished = False
+        self.error: Exception | None = None
+
+    def __iter__(self) -> ReadAhead:
+        return self
+
+    def __next__(self) -> bytes | memoryview:
+        if self._finished:
+            raise StopIteration
+        if not self._thread:
+            # Producer must not refer to self, so that an abandoned reader is
+            # collected and stops the producer by __del__().
+            self._thread = threading.Thread(
+                target=_produce_parts,
+                args=(self._parts, self._items, self._stop),
+                name=self.THREAD_NAME,
+                daemon=True,
+            )
+            self._thread.start()
+        part, exc = self._items.get()
+        if exc:
+            self.error = exc
+            self.close()
+            raise exc
+        if part is None:
+            self.close()
+            raise StopIteration
+        return part
+
+    def close(self):
+        """Stop background reading."""
+        self._finished = True
+        self._stop.set()
+
+    def join(self):
+        """
+        Wait for background reading to stop after close(); the producer
+        notices it within a poll interval once its current read returns.
+        """
+        if self._thread:
+            self._thread.join()
+
+    def __del__(self):
+        self.close()
+
+
+def _produce_parts(
+        parts: Iterator[bytes | memoryview],
+        items: queue.Queue,
+        stop: threading.Event,
+):
+    """Put parts, then end marker or error, to queue till stop is set."""
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=_READ_AHEAD_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    try:
+        for part in parts:
+            if not put((part, None)):
+                return
+        put((None, None))
+    except Exception as exc:  # pylint: disable=broad-except
+        put((None, exc))
+
+
+def get_stream_remaining_size(stream: BinaryIO) -> int:
+    """
+    Get size of data left to read in a seekable stream; -1 for other
+    streams.
+    """
+    try:
+        if not stream.seekable():
+            return -1
+        try:
+            stat_result = os.fstat(stream.fileno())
+            if statmod.S_ISREG(stat_result.st_mode):
+                return stat_result.st_size - stream.tell()
+        except (AttributeError, OSError):
+            pass
+        position = stream.tell()
+        size = stream.seek(0, os.SEEK_END)
+        stream.seek(position)
+        return size - position
+    except (AttributeError, OSError, ValueError):
+        return -1
+
+
+class BodyReader:
+    """
+    Reader of length bytes from a seekable stream as request body. It is
+    seekable by tell()/seek(), so HTTP client can rewind it on retry;
+    progress is updated for data read first time only.
+    """
+
+    def __init__(
+            self,
+            stream: BinaryIO,
+            length: int,
+            progress: ProgressType | None = None,
+    ):
+        self._stream = stream
+        self._position = stream.tell()
+        self._end = self._position + length
+        self._reported = self._position
+        self._progress = progress
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes, not going beyond length."""
+        remaining = self._end - self._position
+        size = remaining if size < 0 else min(size, remaining)
+        data = read_part_data(self._stream, size)
+        if len(data) != size:
+            raise IOError(
+                f"stream having not enough data;"
+                f"expected: {remaining}, "
+                f"got: {len(data)} bytes"
+            )
+        self._position += size
+        if self._progress and self._position > self._reported:
+            self._progress.update(self._position - self._reported)
+            self._reported = self._position
+        return data
+
+    def tell(self) -> int:
+        """Get position in the stream."""
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Set position in the stream."""
+        self._position = self._stream.seek(offset, whence)
+        return self._position
 
 
 def makedirs(path: str):
@@ -186,17 +412,33 @@ def makedirs(path: str):
             raise ValueError(f"path {path} is not a directory") from exc
 
 
+def _is_ipv4_address(value: str) -> bool:
+    """Check whether value is a dotted decimal IPv4 address."""
+    if value.count(".") != 3:
+        return False
+    return all(
+        octet.isdigit() and octet.isascii() and len(octet) <= 3 and
+        (octet[0] != "0" or octet == "0") and int(octet) <= 255
+        for octet in value.split(".")
+    )
+
+
+@functools.lru_cache(maxsize=256)
 def check_bucket_name(
         bucket_name: str,
         strict: bool = False,
 ):
-    """Check whether bucket name is valid optional with strict check or not."""
+    """
+    Check whether bucket name is valid optional with strict check or not.
+    Valid names are cached as the same few buckets are checked on every
+    request; invalid names raise and are not cached.
+    """
 
     if strict:
         if not _BUCKET_NAME_REGEX.match(bucket_name):
             raise ValueError(f'invalid bucket name {bucket_name}')
 
-    if _IPV4_REGEX.match(bucket_name):
+    if _is_ipv4_address(bucket_name):
         raise ValueError(f'bucket name {bucket_name} must not be formatted '
                          'as an IP address')
 
@@ -280,12 +522,16 @@ class BaseURL:
     _virtual_style_flag: bool
     _url: urllib.parse.SplitResult
     _accelerate_host_flag: bool
+    _build_cached: Callable[..., urllib.parse.SplitResult]
 
     def __init__(self, endpoint: str):
         url = _parse_url(endpoint)
 
         self._url = url
         self._accelerate_host_flag = False
+        # Requests usually address the same few objects repeatedly, so keep
+        # the built URLs of this endpoint in a bounded cache.
+        self._build_cached = functools.lru_cache(maxsize=1024)(self._build)
 
     @property
     def is_https(self) -> bool:
@@ -350,11 +596,34 @@ class BaseURL:
                 f"empty bucket name for object name {object_name}",
             )
 
+        try:
+            return self._build_cached(
+                request_path,
+                bucket_name,
+                object_name,
+                tuple(sorted((query_params or {}).items())),
+            )
+        except TypeError:  # multi-valued query parameter is not hashable
+            return self._build(
+                request_path,
+                bucket_name,
+                object_name,
+                tuple(sorted((query_params or {}).items())),
+            )
+
+    def _build(
+            self,
+            request_path: str,
+            bucket_name: str | None,
+            object_name: str | None,
+            query_items: tuple,
+    ) -> urllib.parse.SplitResult:
+        """Build URL for given request path, bucket, object and query."""
         path = f"{request_path}{bucket_name}"
         url = url_replace(self._url, path=path)
 
         query = []
-        for key, values in sorted((query_params or {}).items()):
+        for key, values in query_items:
             values = values if isinstance(values, (list, tuple)) else [values]
             query += [
                 f"{queryencode(key)}={queryencode(value)}"
@@ -372,6 +641,10 @@ class BaseURL:
 
 class ObjectWriteResult:
     """Result class of any APIs doing object creation."""
+    __slots__ = (
+        "_bucket_name", "_prefix", "_object_name", "_http_headers",
+        "_last_modified",
+    )
 
     def __init__(
             self,
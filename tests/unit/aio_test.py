@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# Newtera Python Library for Newtera TDM,
+# (C) 2024 Newtera, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest import TestCase, mock
+
+import urllib3
+
+from newtera.aio import AsyncNewtera
+
+
+@mock.patch("newtera.aio.Newtera")
+class AsyncNewteraTest(TestCase):
+    def test_operations(self, newtera):
+        client = newtera.return_value
+        client.stat_object.return_value = "my-stat"
+        client.stat_objects.return_value = iter(
+            [("my-object1", "stat1"), ("my-object2", "stat2")],
+        )
+        client.remove_objects.return_value = [("my-object2", ValueError())]
+
+        async def run():
+            async with AsyncNewtera("localhost:8080") as aio_client:
+                return (
+                    await aio_client.stat_object(
+                        "tdm", "my-prefix", "my-object",
+                    ),
+                    await aio_client.stat_objects(
+                        "tdm", "my-prefix", ["my-object1", "my-object2"],
+                    ),
+                    await aio_client.remove_objects(
+                        "tdm", "my-prefix", ["my-object1", "my-object2"],
+                    ),
+                )
+
+        stat, stats, errors = asyncio.run(run())
+        self.assertEqual(stat, "my-stat")
+        self.assertEqual(
+            stats, [("my-object1", "stat1"), ("my-object2", "stat2")],
+        )
+        self.assertEqual([name for name, _ in errors], ["my-object2"])
+        client.stat_object.assert_called_once_with(
+            "tdm", "my-prefix", "my-object", extra_headers=None,
+        )
+        client.stat_objects.assert_called_once_with(
+            "tdm", "my-prefix", ["my-object1", "my-object2"],
+            max_workers=None,
+        )
+        client.remove_objects.assert_called_once_with(
+            "tdm", "my-prefix", ["my-object1", "my-object2"],
+            max_workers=None,
+        )
+        client._http.clear.assert_called_once_with()
+
+    def test_close_keeps_supplied_http_client(self, newtera):
+        async def run():
+            async with AsyncNewtera(
+                    "localhost:8080", http_client=urllib3.PoolManager(),
+            ):
+                pass
+
+        asyncio.run(run())
+        newtera.return_value._http.clear.assert_not_called()
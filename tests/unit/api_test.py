@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# Newtera Python Library for Newtera TDM, (C)
+# 2015, 2016, 2017 Newtera, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, mock
+from urllib.parse import urlsplit
+
+from urllib3 import PoolManager
+from urllib3.exceptions import ProtocolError
+from urllib3.response import HTTPResponse
+
+from newtera import Newtera
+from newtera.api import _TRACE_BODY_LIMIT, _trace_body
+from newtera.error import NewteraException
+
+_RANGE_SIZE = 1024
+
+
+class _Pool(PoolManager):
+    """Connection pool serving objects from memory."""
+
+    def __init__(self, objects):
+        super().__init__()
+        self.objects = objects
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def urlopen(self, method, url, body=None, headers=None,
+                preload_content=True, retries=None):
+        name = urlsplit(url).path.rsplit("/", 1)[-1]
+        with self._lock:
+            self.requests.append((method, name, dict(headers or {})))
+        return self.respond(method, name, headers or {}, preload_content)
+
+    def respond(self, method, name, headers, preload_content):
+        data = self.objects.get(name)
+        if data is None:
+            return HTTPResponse(
+                body=io.BytesIO(b""), status=404,
+                preload_content=preload_content,
+            )
+        if method == "HEAD":
+            return HTTPResponse(
+                body=io.BytesIO(b""), status=200,
+                headers={"Length": str(len(data))},
+                preload_content=preload_content,
+            )
+        if method == "DELETE":
+            return HTTPResponse(
+                body=io.BytesIO(b""), status=204,
+                preload_content=preload_content,
+            )
+        start, end, status = 0, len(data) - 1, 200
+        response_headers = {}
+        if "Range" in headers:
+            first, last = headers["Range"][len("bytes="):].split("-")
+            start, end, status = int(first), int(last), 206
+            response_headers["Content-Range"] = (
+                f"bytes {start}-{end}/{len(data)}"
+            )
+        return HTTPResponse(
+            body=io.BytesIO(self.range_data(data, start, end)),
+            status=status,
+            headers=response_headers,
+            preload_content=preload_content,
+        )
+
+    def range_data(self, data, start, end):
+        return data[start:end + 1]
+
+
+class _IgnoreRangePool(_Pool):
+    def respond(self, method, name, headers, preload_content):
+        headers = {k: v for k, v in headers.items() if k != "Range"}
+        return super().respond(method, name, headers, preload_content)
+
+
+class _ShortRangePool(_Pool):
+    def range_data(self, data, start, end):
+        return data[start:end] if start else data[start:end + 1]
+
+
+class _WrongTotalPool(_Pool):
+    def respond(self, method, name, headers, preload_content):
+        response = super().respond(method, name, headers, preload_content)
+        if response.status == 206:
+            response.headers["Content-Range"] = "bytes 0-1023/1"
+        return response
+
+
+class _BrokenPool(_Pool):
+    """Pool failing to connect for object named broken."""
+
+    def respond(self, method, name, headers, preload_content):
+        if name == "broken":
+            raise ProtocolError("Connection aborted.")
+        return super().respond(method, name, headers, preload_content)
+
+
+class _Progress:
+    def __init__(self):
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def set_meta(self, object_name, total_length):
+        pass
+
+    def update(self, length):
+        with self._lock:
+            self.total += length
+
+
+@mock.patch("newtera.api._DOWNLOAD_RANGE_SIZE", _RANGE_SIZE)
+@mock.patch("newtera.api._PARALLEL_DOWNLOAD_MIN_SIZE", 2 * _RANGE_SIZE)
+class FGetObjectTest(TestCase):
+    def setUp(self):
+        self.data = os.urandom(10 * _RANGE_SIZE + 13)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmpdir.name, "my-file")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _fget(self, pool, data, progress=None):
+        client = Newtera("localhost:8080", http_client=pool)
+        pool.objects["my-object"] = data
+        return client.fget_object(
+            "tdm", "my-prefix", "my-object", self.file_path,
+            progress=progress,
+        )
+
+    def _ranges(self, pool):
+        return sorted(
+            headers.get("Range") for method, _, headers in pool.requests
+            if method == "GET"
+        )
+
+    def test_ranges(self):
+        pool = _Pool({})
+        progress = _Progress()
+        self._fget(pool, self.data, progress=progress)
+        with open(self.file_path, "rb") as file:
+            self.assertEqual(file.read(), self.data)
+        self.assertEqual(progress.total, len(self.data))
+        self.assertEqual(len(self._ranges(pool)), 11)
+
+    def test_range_ignored(self):
+        pool = _IgnoreRangePool({})
+        self._fget(pool, self.data)
+        with open(self.file_path, "rb") as file:
+            self.assertEqual(file.read(), self.data)
+        self.assertEqual(len(self._ranges(pool)), 1)
+
+    def test_short_range(self):
+        with self.assertRaises(IOError):
+            self._fget(_ShortRangePool({}), self.data)
+        self.assertFalse(os.path.exists(self.file_path))
+
+    def test_content_range_total_mismatch(self):
+        with self.assertRaises(IOError):
+            self._fget(_WrongTotalPool({}), self.data)
+        self.assertFalse(os.path.exists(self.file_path))
+
+    def test_parallel_download_min_size(self):
+        pool = _Pool({})
+        data = self.data[:2 * _RANGE_SIZE]
+        self._fget(pool, data)
+        with open(self.file_path, "rb") as file:
+            self.assertEqual(file.read(), data)
+        self.assertEqual(self._ranges(pool), [None])
+
+
+class RemoveObjectsTest(TestCase):
+    def test_errors(self):
+        pool = _BrokenPool({"my-object": b"data"})
+        client = Newtera("localhost:8080", http_client=pool)
+        errors = dict(
+            client.remove_objects(
+                "tdm", "my-prefix", ["my-object", "missing", "broken"],
+            ),
+        )
+        self.assertEqual(sorted(errors), ["broken", "missing"])
+        self.assertIsInstance(errors["missing"], NewteraException)
+        self.assertIsInstance(errors["broken"], ProtocolError)
+        self.assertEqual(
+            sorted(name for method, name, _ in pool.requests),
+            ["broken", "missing", "my-object"],
+        )
+
+    @mock.patch(
+        "newtera.api.ThreadPoolExecutor", wraps=ThreadPoolExecutor,
+    )
+    def test_max_workers(self, executor):
+        client = Newtera(
+            "localhost:8080", http_client=_Pool({}), maxsize=3,
+        )
+        client.remove_objects("tdm", "my-prefix", ["my-object"])
+        executor.assert_called_once_with(max_workers=3)
+        executor.reset_mock()
+        client.remove_objects(
+            "tdm", "my-prefix", ["my-object"], max_workers=2,
+        )
+        executor.assert_called_once_with(max_workers=2)
+
+
+class StatObjectsTest(TestCase):
+    def test_results(self):
+        pool = _BrokenPool({"my-object": b"data"})
+        client = Newtera("localhost:8080", http_client=pool)
+        results = dict(
+            client.stat_objects(
+                "tdm", "my-prefix", ["my-object", "missing", "broken"],
+            ),
+        )
+        self.assertEqual(
+            sorted(results), ["broken", "missing", "my-object"],
+        )
+        self.assertEqual(results["my-object"].size, 4)
+        self.assertIsInstance(results["missing"], NewteraException)
+        self.assertIsInstance(results["broken"], ProtocolError)
+
+    def test_bounded_submission(self):
+        pool = _Pool({f"my-object{i}": b"data" for i in range(100)})
+        client = Newtera("localhost:8080", http_client=pool)
+        taken = []
+
+        def object_names():
+            for i in range(100):
+                taken.append(i)
+                yield f"my-object{i}"
+
+        for _ in client.stat_objects(
+                "tdm", "my-prefix", object_names(), max_workers=2,
+        ):
+            break
+        self.assertLessEqual(len(taken), 4)
+        self.assertLessEqual(len(pool.requests), 4)
+
+
+class TraceBodyTest(TestCase):
+    def test_invalid_utf8(self):
+        self.assertEqual(_trace_body(b"ok\xff"), "ok\ufffd")
+        data = b"\xff" * (_TRACE_BODY_LIMIT + 1)
+        self.assertEqual(
+            _trace_body(data),
+            "\ufffd" * _TRACE_BODY_LIMIT + f"...({len(data)} bytes)",
+        )
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Newtera Python Library for Newtera TDM, (C)
+# 2015, 2016, 2017 Newtera, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import threading
+import time
+from unittest import TestCase
+
+from newtera.helpers import BodyReader, ReadAhead, iter_part_data
+
+
+def _parts(error=None):
+    yield b"a"
+    yield b"b"
+    yield b"c"
+    if error:
+        raise error
+
+
+def _producers():
+    return [
+        thread for thread in threading.enumerate()
+        if thread.name == ReadAhead.THREAD_NAME
+    ]
+
+
+def _wait_producers(timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not _producers():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class ReadAheadTest(TestCase):
+    def test_read_all(self):
+        reader = ReadAhead(_parts())
+        self.assertEqual(list(reader), [b"a", b"b", b"c"])
+        self.assertTrue(_wait_producers())
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_error(self):
+        reader = ReadAhead(_parts(IOError("not enough data")))
+        with self.assertRaises(IOError):
+            list(reader)
+        self.assertIsInstance(reader.error, IOError)
+        self.assertTrue(_wait_producers())
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_close_stops_blocked_producer(self):
+        reader = ReadAhead(_parts(IOError("not enough data")))
+        self.assertEqual(next(reader), b"a")
+        time.sleep(0.2)  # let producer block on full queue
+        self.assertEqual(len(_producers()), 1)
+        reader.close()
+        reader.join()
+        self.assertEqual(_producers(), [])
+        self.assertRaises(StopIteration, next, reader)
+
+    def test_abandoned_reader_stops_producer(self):
+        reader = ReadAhead(_parts())
+        self.assertEqual(next(reader), b"a")
+        time.sleep(0.2)
+        self.assertEqual(len(_producers()), 1)
+        del reader
+        self.assertTrue(_wait_producers())
+
+
+class _ReadOnlyStream(io.RawIOBase):
+    """Raw stream implementing read() only, so readinto() is unsupported."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        size = len(self._data) if size < 0 else size
+        data, self._data = self._data[:size], self._data[size:]
+        return data
+
+
+class IterPartDataTest(TestCase):
+    def test_read_only_raw_stream(self):
+        data = bytes(range(256)) * 40
+        for object_size in (len(data), -1):
+            parts = [
+                bytes(part) for part in iter_part_data(
+                    _ReadOnlyStream(data), object_size, 4096, buffer_count=3,
+                )
+            ]
+            self.assertEqual([len(part) for part in parts], [4096, 4096, 2048])
+            self.assertEqual(b"".join(parts), data)
+
+    def test_reused_buffers(self):
+        data = bytes(range(256)) * 40
+        parts = [
+            bytes(part) for part in iter_part_data(
+                io.BytesIO(data), len(data), 4096, buffer_count=3,
+            )
+        ]
+        self.assertEqual(b"".join(parts), data)
+
+
+class _Progress:
+    def __init__(self):
+        self.total = 0
+
+    def set_meta(self, object_name, total_length):
+        pass
+
+    def update(self, length):
+        self.total += length
+
+
+class BodyReaderTest(TestCase):
+    def test_read_length(self):
+        stream = io.BytesIO(b"headdatatail")
+        stream.seek(4)
+        reader = BodyReader(stream, 4)
+        self.assertEqual(reader.read(3), b"dat")
+        self.assertEqual(reader.read(3), b"a")
+        self.assertEqual(reader.read(3), b"")
+
+    def test_rewind_updates_progress_once(self):
+        stream = io.BytesIO(b"data")
+        progress = _Progress()
+        reader = BodyReader(stream, 4, progress=progress)
+        position = reader.tell()
+        self.assertEqual(reader.read(), b"data")
+        reader.seek(position)
+        self.assertEqual(reader.read(), b"data")
+        self.assertEqual(progress.total, 4)
+
+    def test_not_enough_data(self):
+        reader = BodyReader(io.BytesIO(b"data"), 8)
+        with self.assertRaises(IOError):
+            reader.read()